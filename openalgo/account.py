@@ -21,7 +21,7 @@ class AccountAPI(BaseAPI):
                     'status': 'error',
                     'message': f'HTTP {response.status_code}: {response.text}'
                 }
-            return response.json()
+            return self._parse_json(response)
         except requests.exceptions.JSONDecodeError:
             return {
                 'status': 'error',
@@ -55,7 +55,7 @@ class AccountAPI(BaseAPI):
         payload = {
             "apikey": self.api_key
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         return self._handle_response(response)
 
     def orderbook(self):
@@ -97,7 +97,7 @@ class AccountAPI(BaseAPI):
         payload = {
             "apikey": self.api_key
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         return self._handle_response(response)
 
     def tradebook(self):
@@ -128,7 +128,7 @@ class AccountAPI(BaseAPI):
         payload = {
             "apikey": self.api_key
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         return self._handle_response(response)
 
     def positionbook(self):
@@ -155,7 +155,7 @@ class AccountAPI(BaseAPI):
         payload = {
             "apikey": self.api_key
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         return self._handle_response(response)
 
     def holdings(self):
@@ -191,5 +191,5 @@ class AccountAPI(BaseAPI):
         payload = {
             "apikey": self.api_key
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         return self._handle_response(response)
@@ -4,13 +4,36 @@ OpenAlgo REST API Documentation - Base API Class
     https://docs.openalgo.in
 """
 
+import math
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json used by requests
+    orjson = None
+
+_instances_lock = threading.Lock()
+
+def _has_non_finite(value):
+    """Return True if a payload contains a NaN or infinite float anywhere."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
 
 class BaseAPI:
     """
     Base class to handle all the API calls to OpenAlgo.
     """
 
+    _instances = {}
+
     def __init__(self, api_key, host="http://127.0.0.1:5000", version="v1"):
         """
         Initialize the api object with an API key and optionally a host URL and API version.
@@ -25,3 +48,59 @@ class BaseAPI:
         self.headers = {
             'Content-Type': 'application/json'
         }
+
+        # Reuse one pooled session so consecutive calls share keep-alive connections
+        # instead of paying a TCP/TLS handshake per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @classmethod
+    def shared(cls, api_key, host="http://127.0.0.1:5000", version="v1"):
+        """
+        Return a process-wide client for the given API key, host and version.
+
+        Repeated calls with the same arguments return the same instance, so every
+        caller shares a single connection pool instead of creating its own.
+        """
+        key = (cls, api_key, host, version)
+        with _instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = cls(api_key, host=host, version=version)
+        return instance
+
+    def _post(self, url, payload):
+        """POST a JSON payload on the shared session, encoding with orjson when installed."""
+        # orjson writes NaN/Infinity as null, so leave those to json=, which rejects them
+        if orjson is not None and not _has_non_finite(payload):
+            try:
+                data = orjson.dumps(payload)
+            except orjson.JSONEncodeError:
+                # float subclasses, non-str keys and ints over 64 bits are only handled by json=
+                pass
+            else:
+                return self._session.post(url, data=data, headers=self.headers)
+        return self._session.post(url, json=payload, headers=self.headers)
+
+    def _parse_json(self, response):
+        """
+        Decode a JSON response body, using orjson when installed.
+
+        Bodies orjson rejects are retried with response.json(). orjson does not
+        reject integers wider than 64 bits but decodes them as floats, so such
+        values lose precision on the orjson path.
+        """
+        if orjson is None:
+            return response.json()
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and non-UTF-8 bodies that the stdlib accepts,
+            # so let response.json() decide; it raises requests' JSONDecodeError on failure
+            return response.json()
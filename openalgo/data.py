@@ -35,7 +35,7 @@ class DataAPI(BaseAPI):
                         'error_type': 'http_error'
                     }
                 
-                data = response.json()
+                data = self._parse_json(response)
                 if data.get('status') == 'error':
                     return {
                         'status': 'error',
@@ -58,7 +58,7 @@ class DataAPI(BaseAPI):
                     'message': str(e),
                     'error_type': 'unknown_error'
                 }
-        return response.json()  # Return last response if all retries failed
+        return self._parse_json(response)  # Return last response if all retries failed
 
     def quotes(self, *, symbol, exchange):
         """
@@ -77,7 +77,7 @@ class DataAPI(BaseAPI):
             "symbol": symbol,
             "exchange": exchange
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         return self._handle_response(response)
 
     def depth(self, *, symbol, exchange):
@@ -97,7 +97,7 @@ class DataAPI(BaseAPI):
             "symbol": symbol,
             "exchange": exchange
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         return self._handle_response(response)
 
     def history(self, *, symbol, exchange, interval, start_date, end_date):
@@ -128,7 +128,7 @@ class DataAPI(BaseAPI):
             "end_date": end_date
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._post(url, payload)
         result = self._handle_response(response)
         
         if result.get('status') == 'success' and 'data' in result:
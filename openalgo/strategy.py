@@ -3,9 +3,38 @@ OpenAlgo Strategy Module for TradingView Integration
 """
 
 from typing import Optional
+import functools
+import json
 import requests
+from .base import orjson
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+@functools.lru_cache(maxsize=1024)
+def _webhook_payload(symbol: str, action: str, position_size: Optional[str]) -> bytes:
+    """
+    Build the serialized webhook message for a signal.
+    Cached so repeated signals on the same symbol reuse the encoded bytes.
+    position_size must already be a string (or None) so sizes like 1 and 1.0
+    never share a cache entry.
+    """
+    post_message = {
+        "symbol": symbol,
+        "action": action.upper()
+    }
+
+    if position_size is not None:
+        post_message["position_size"] = position_size
+
+    if orjson is None:
+        return json.dumps(post_message).encode('utf-8')
+    return orjson.dumps(post_message)
+
 
 class Strategy:
+    __slots__ = ('_host_url', '_webhook_id', '_webhook_url')
+
     def __init__(self, host_url: str, webhook_id: str):
         """
         Initialize strategy with host URL and webhook ID
@@ -43,17 +72,11 @@ class Strategy:
         Raises:
             requests.exceptions.RequestException: If the webhook request fails
         """
-        # Prepare message
-        post_message = {
-            "symbol": symbol,
-            "action": action.upper()
-        }
-        
-        if position_size is not None:
-            post_message["position_size"] = str(position_size)
-            
+        size = None if position_size is None else str(position_size)
+        payload = _webhook_payload(symbol, action, size)
+
         try:
-            response = requests.post(self.webhook_url, json=post_message)
+            response = requests.post(self.webhook_url, data=payload, headers=_JSON_HEADERS)
             response.raise_for_status()  # Raise exception for bad status codes
             return response.json()
         except requests.exceptions.RequestException as e:
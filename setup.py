@@ -26,6 +26,9 @@ setup(
         "requests>=2.25.0",
         "pandas>=1.2.0"
     ],
+    extras_require={
+        "fast": ["orjson>=3.6.0"]
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -0,0 +1,139 @@
+import math
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from openalgo import api, base
+
+
+def make_response(body, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.encoding = 'utf-8'
+    return response
+
+
+class ParseJsonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = api(api_key="test_key")
+
+    def test_stdlib_path(self):
+        with mock.patch.object(base, "orjson", None):
+            result = self.client._parse_json(make_response(b'{"status": "success"}'))
+        self.assertEqual(result, {"status": "success"})
+
+    @unittest.skipIf(base.orjson is None, "orjson not installed")
+    def test_orjson_path(self):
+        with mock.patch.object(base.orjson, "loads", wraps=base.orjson.loads) as loads:
+            result = self.client._parse_json(make_response(b'{"status": "success"}'))
+        self.assertEqual(result, {"status": "success"})
+        loads.assert_called_once()
+
+    def test_nan_body_decodes_on_both_paths(self):
+        body = b'{"status":"success","data":{"ltp":NaN}}'
+        for orjson in {None, base.orjson}:
+            with mock.patch.object(base, "orjson", orjson):
+                result = self.client._parse_json(make_response(body))
+            self.assertEqual(result["status"], "success")
+            self.assertTrue(math.isnan(result["data"]["ltp"]))
+
+    def test_invalid_body_raises_requests_json_error(self):
+        for orjson in {None, base.orjson}:
+            with mock.patch.object(base, "orjson", orjson):
+                with self.assertRaises(requests.exceptions.JSONDecodeError):
+                    self.client._parse_json(make_response(b'not json'))
+
+    def test_invalid_body_maps_to_error_dict(self):
+        result = self.client._handle_response(make_response(b'not json'))
+        self.assertEqual(result['status'], 'error')
+        self.assertEqual(result['message'], 'Invalid JSON response from server')
+        self.assertEqual(result['raw_response'], 'not json')
+
+
+class PostTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = api(api_key="test_key")
+        self.url = self.client.base_url + "placeorder"
+
+    def post_kwargs(self, payload):
+        with mock.patch.object(self.client._session, "post") as post:
+            self.client._post(self.url, payload)
+        return post.call_args.kwargs
+
+    @unittest.skipIf(base.orjson is None, "orjson not installed")
+    def test_orjson_encodes_plain_payload(self):
+        kwargs = self.post_kwargs({"symbol": "RELIANCE", "quantity": "1"})
+        self.assertEqual(kwargs["data"], b'{"symbol":"RELIANCE","quantity":"1"}')
+        self.assertNotIn("json", kwargs)
+
+    def test_stdlib_path(self):
+        with mock.patch.object(base, "orjson", None):
+            kwargs = self.post_kwargs({"symbol": "RELIANCE"})
+        self.assertEqual(kwargs["json"], {"symbol": "RELIANCE"})
+
+    def test_values_orjson_refuses_fall_back_to_json(self):
+        class Price(float):
+            pass
+
+        for payload in ({"price": Price(1.5)}, {1: "one"}, {"quantity": 2 ** 70}):
+            kwargs = self.post_kwargs(payload)
+            self.assertEqual(kwargs["json"], payload)
+            self.assertNotIn("data", kwargs)
+
+    def test_non_finite_floats_are_rejected_on_both_paths(self):
+        payload = {"orders": [{"price": float("nan")}]}
+        for orjson in {None, base.orjson}:
+            with mock.patch.object(base, "orjson", orjson):
+                with self.assertRaises(requests.exceptions.InvalidJSONError):
+                    self.client._post("http://127.0.0.1:1/api/v1/basketorder", payload)
+
+
+class SharedClientTest(unittest.TestCase):
+
+    def tearDown(self):
+        for client in base.BaseAPI._instances.values():
+            client._session.close()
+        base.BaseAPI._instances.clear()
+
+    def test_same_key_and_host_returns_same_instance(self):
+        client = api.shared("shared_key", "http://127.0.0.1:5000")
+        self.assertIs(client, api.shared("shared_key", "http://127.0.0.1:5000"))
+        self.assertIsInstance(client, api)
+
+    def test_different_host_returns_distinct_instance(self):
+        local = api.shared("shared_key", "http://127.0.0.1:5000")
+        remote = api.shared("shared_key", "http://10.0.0.1:5000")
+        self.assertIsNot(local, remote)
+        self.assertEqual(remote.base_url, "http://10.0.0.1:5000/api/v1/")
+
+    def test_concurrent_calls_share_one_instance(self):
+        results = []
+        barrier = threading.Barrier(8)
+        real_session = requests.Session
+
+        def slow_session():
+            # Widen the window between the cache lookup and insert so unguarded calls interleave
+            time.sleep(0.05)
+            return real_session()
+
+        def worker():
+            barrier.wait()
+            results.append(api.shared("threaded_key", "http://127.0.0.1:5000"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        with mock.patch.object(base.requests, "Session", side_effect=slow_session):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len({id(client) for client in results}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import socket
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from openalgo import api
+
+
+class SessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = api(api_key="test_key")
+
+    def test_placeorder_posts_through_session(self):
+        with mock.patch.object(self.client._session, "post") as post:
+            post.return_value.status_code = 200
+            post.return_value.json.return_value = {"status": "success", "orderid": "1"}
+            with mock.patch("openalgo.base.orjson", None):
+                result = self.client.placeorder(symbol="RELIANCE", action="BUY", exchange="NSE")
+        self.assertEqual(result, {"status": "success", "orderid": "1"})
+        post.assert_called_once()
+        self.assertEqual(post.call_args.args[0], "http://127.0.0.1:5000/api/v1/placeorder")
+
+    def test_retry_never_replays_post(self):
+        for prefix in ("http://", "https://"):
+            retries = self.client._session.get_adapter(prefix + "example.com").max_retries
+            self.assertNotIn("POST", retries.allowed_methods)
+
+    def test_order_is_sent_once_when_server_drops_connection(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(5)
+        server.settimeout(0.1)
+        stop = threading.Event()
+        received = []
+
+        def serve():
+            # Read each request and hang up without replying, as a crashed server would
+            while not stop.is_set():
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                received.append(conn.recv(65536))
+                conn.close()
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        host = f"http://127.0.0.1:{server.getsockname()[1]}"
+        client = api(api_key="test_key", host=host)
+        try:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.placeorder(symbol="RELIANCE", action="BUY", exchange="NSE")
+        finally:
+            stop.set()
+            thread.join(5)
+            server.close()
+        self.assertEqual(len(received), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
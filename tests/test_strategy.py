@@ -0,0 +1,36 @@
+import json
+import unittest
+from unittest import mock
+
+from openalgo import Strategy, strategy
+
+
+class StrategyOrderTest(unittest.TestCase):
+
+    def setUp(self):
+        strategy._webhook_payload.cache_clear()
+        self.client = Strategy(host_url="http://127.0.0.1:5000", webhook_id="test-webhook")
+
+    def sent_payloads(self, *position_sizes):
+        with mock.patch.object(strategy.requests, "post") as post:
+            post.return_value.json.return_value = {"status": "success"}
+            for position_size in position_sizes:
+                self.client.strategyorder("RELIANCE", "buy", position_size)
+        return [json.loads(call.kwargs["data"]) for call in post.call_args_list]
+
+    def test_message_format(self):
+        sent = self.sent_payloads(None, 0)
+        self.assertEqual(sent[0], {"symbol": "RELIANCE", "action": "BUY"})
+        self.assertEqual(sent[1], {"symbol": "RELIANCE", "action": "BUY", "position_size": "0"})
+
+    def test_int_and_float_sizes_produce_different_payloads(self):
+        sent = self.sent_payloads(1, 1.0, 1)
+        self.assertEqual([msg["position_size"] for msg in sent], ["1", "1.0", "1"])
+
+    def test_float_first_does_not_leak_into_int_calls(self):
+        sent = self.sent_payloads(1.0, 1)
+        self.assertEqual([msg["position_size"] for msg in sent], ["1.0", "1"])
+
+
+if __name__ == '__main__':
+    unittest.main()